@@ -7,13 +7,17 @@ from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery
 from aiogram.fsm.context import FSMContext
 
-from utils.keyboard import get_admin_keyboard, get_admin_deal_keyboard, get_main_menu
+from utils.keyboard import get_admin_keyboard, get_admin_deal_keyboard, get_disputes_keyboard, get_main_menu
 from utils.database import get_all_deals, get_deal, update_deal_status, get_deal_stats
 from utils.security import is_admin
 from config import EMOJIS, ADMIN_USER
 
 router = Router()
 
+# Dispute paging; next-page callbacks carry the (id, created_at) cursor of the last dispute shown
+_DISPUTES_PAGE_SIZE = 10
+_DISPUTES_NEXT = "admin_disputes_next_"
+
 @router.message(Command("admin"))
 async def admin_panel(message: Message):
     """Show admin panel"""
@@ -57,7 +61,7 @@ async def show_all_deals(callback: CallbackQuery):
         await callback.answer(f"{EMOJIS['error']} Access denied!")
         return
     
-    deals = await get_all_deals()
+    deals = await get_all_deals(limit=10)
     
     if not deals:
         await callback.message.edit_text(
@@ -73,7 +77,7 @@ async def show_all_deals(callback: CallbackQuery):
     
     deals_text = f"{EMOJIS['shield']} <b>All Deals</b>\n\n"
     
-    for deal in deals[-10:]:  # Show last 10 deals
+    for deal in deals:  # Latest 10 deals
         status_emoji = {
             'created': EMOJIS['loading'],
             'funded': EMOJIS['money'],
@@ -97,15 +101,25 @@ async def show_all_deals(callback: CallbackQuery):
     
     await callback.answer()
 
-@router.callback_query(F.data == "admin_disputes")
+@router.callback_query((F.data == "admin_disputes") | F.data.startswith(_DISPUTES_NEXT))
 async def show_disputes(callback: CallbackQuery):
-    """Show disputed deals"""
+    """Show disputed deals, one page at a time"""
     
     if not await is_admin(callback.from_user.id, callback.from_user.username):
         await callback.answer(f"{EMOJIS['error']} Access denied!")
         return
     
-    deals = await get_all_deals(status='disputed')
+    before = None
+    if callback.data.startswith(_DISPUTES_NEXT):
+        last_id, last_created_at = callback.data[len(_DISPUTES_NEXT):].split("_", 1)
+        before = (last_created_at, int(last_id))
+    
+    # Fetch one extra row to tell whether another page follows
+    deals = await get_all_deals(status='disputed', limit=_DISPUTES_PAGE_SIZE + 1, before=before)
+    next_page = None
+    if len(deals) > _DISPUTES_PAGE_SIZE:
+        deals = deals[:_DISPUTES_PAGE_SIZE]
+        next_page = f"{_DISPUTES_NEXT}{deals[-1]['id']}_{deals[-1]['created_at']}"
     
     if not deals:
         await callback.message.edit_text(
@@ -133,12 +147,16 @@ All deals are running smoothly.
 
 """
     
+    if next_page:
+        disputes_text += f"{EMOJIS['warning']} <i>More disputes on the next page.</i>"
+    
     await callback.message.edit_text(
         disputes_text,
-        reply_markup=get_admin_keyboard()
+        reply_markup=get_disputes_keyboard(next_page)
     )
     
-    await callback.answer(f"{EMOJIS['shield']} {len(deals)} disputes found")
+    shown = f"{len(deals)}+" if next_page else f"{len(deals)}"
+    await callback.answer(f"{EMOJIS['shield']} {shown} disputes found")
 
 @router.callback_query(F.data.startswith("admin_deal_"))
 async def admin_deal_details(callback: CallbackQuery):
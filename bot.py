@@ -9,7 +9,8 @@ from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 
 from handlers import start, escrow, admin, payment
-from utils.database import init_db
+from utils.database import init_db, close_db
+from utils.security import stop_security_log
 from config import BOT_TOKEN
 
 async def create_bot():
@@ -29,6 +30,8 @@ async def create_bot():
     
     # Initialize database
     await init_db()
+    dp.shutdown.register(close_db)
+    dp.shutdown.register(stop_security_log)
     
     # Include routers
     dp.include_router(start.router)
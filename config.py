@@ -17,9 +17,14 @@ DEFAULT_UPI_ID = "Shouryahooda751-2@oksbi"
 # Security Settings
 MAX_DEALS_PER_USER = 10
 RATE_LIMIT_SECONDS = 5
+RATE_LIMIT_CACHE_SIZE = 50000  # Max users tracked by the in-memory rate limiter
+RATE_LIMIT_MAX_ACTIONS = 3  # Actions allowed per sliding window
+RATE_LIMIT_WINDOW_SECONDS = 15
+RATE_LIMIT_BUCKET_SECONDS = 1
 
 # Database Settings
 DATABASE_FILE = "escrow_bot.db"
+DATABASE_READERS = os.cpu_count() or 4  # Read-only connections in the pool
 
 # Styling Configuration
 COLORS = {
@@ -3,179 +3,359 @@ Database utilities for the escrow bot
 """
 
 import sqlite3
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 import aiosqlite
-from datetime import datetime
-from typing import List, Dict, Optional
-from config import DATABASE_FILE
+from typing import List, Dict, Optional, Iterable, Tuple
+from config import DATABASE_FILE, DATABASE_READERS
 
-async def init_db():
-    """Initialize the database with required tables"""
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """One writer connection plus a queue of read-only connections"""
     
-    async with aiosqlite.connect(DATABASE_FILE) as db:
-        # Users table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                user_id INTEGER PRIMARY KEY,
-                username TEXT,
-                first_name TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                is_active BOOLEAN DEFAULT 1
-            )
-        """)
+    def __init__(self, database: str, readers: int):
+        self._database = database
+        self._size = max(1, readers)
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._all_readers: List[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+    
+    async def _connect(self, query_only: bool = False) -> aiosqlite.Connection:
+        """Open and tune a single connection"""
         
-        # Deals table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS deals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                deal_id TEXT UNIQUE NOT NULL,
-                creator_id INTEGER NOT NULL,
-                description TEXT NOT NULL,
-                amount REAL NOT NULL,
-                terms TEXT NOT NULL,
-                status TEXT DEFAULT 'created',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (creator_id) REFERENCES users (user_id)
-            )
-        """)
+        db = await aiosqlite.connect(self._database, cached_statements=200)
         
-        # Payments table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS payments (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                deal_id TEXT NOT NULL,
-                payer_id INTEGER NOT NULL,
-                amount REAL NOT NULL,
-                payment_method TEXT NOT NULL,
-                reference_id TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (deal_id) REFERENCES deals (deal_id),
-                FOREIGN KEY (payer_id) REFERENCES users (user_id)
-            )
-        """)
+        # Tune SQLite for concurrent reads/writes
+        if not query_only:
+            await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA synchronous=NORMAL")
+        await db.execute("PRAGMA busy_timeout=5000")
+        await db.execute("PRAGMA cache_size=-20000")
+        await db.execute("PRAGMA temp_store=MEMORY")
+        await db.execute("PRAGMA foreign_keys=ON")
+        await db.execute("PRAGMA mmap_size=268435456")
+        if query_only:
+            await db.execute("PRAGMA query_only=1")
+        return db
+    
+    async def open(self):
+        """Open the writer and reader connections if not already open"""
         
-        # Rate limiting table
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS rate_limits (
-                user_id INTEGER PRIMARY KEY,
-                last_action TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                action_count INTEGER DEFAULT 1
-            )
-        """)
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+            
+            # Writer first so WAL mode is set before readers attach; publish the
+            # connections only once all of them opened, so a failure leaves the pool closed
+            opened: List[aiosqlite.Connection] = []
+            try:
+                opened.append(await self._connect())
+                for _ in range(self._size):
+                    opened.append(await self._connect(query_only=True))
+            except BaseException:
+                for db in opened:
+                    await db.close()
+                raise
+            
+            self._writer = opened[0]
+            self._all_readers = opened[1:]
+            for reader in self._all_readers:
+                self._readers.put_nowait(reader)
+    
+    async def close(self):
+        """Close all connections"""
         
-        await db.commit()
+        async with self._open_lock:
+            # Wait for any running transaction, then detach every connection
+            # without awaiting so callers from here on reopen a fresh pool
+            async with self._write_lock:
+                writer, self._writer = self._writer, None
+                self._all_readers = []
+                idle = []
+                while not self._readers.empty():
+                    idle.append(self._readers.get_nowait())
+                
+                if writer is not None:
+                    await writer.close()
+            
+            # Borrowed readers are closed by read() when they are handed back
+            for reader in idle:
+                await reader.close()
+    
+    @asynccontextmanager
+    async def read(self):
+        """Borrow a read-only connection"""
+        
+        if self._writer is None:
+            await self.open()
+        
+        db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            if db in self._all_readers:
+                self._readers.put_nowait(db)
+            else:
+                # The pool was closed while this reader was borrowed
+                await db.close()
+    
+    @asynccontextmanager
+    async def write(self):
+        """Hold the writer connection exclusively"""
+        
+        while True:
+            if self._writer is None:
+                await self.open()
+            
+            async with self._write_lock:
+                # The pool may have been closed while waiting for the lock
+                if self._writer is not None:
+                    yield self._writer
+                    return
+
+# Column projections for the read helpers; rows are zipped with these keys
+_USER_KEYS = ("user_id", "username", "first_name", "is_active", "created_at")
+_DEAL_KEYS = ("deal_id", "creator_id", "description", "amount", "terms", "status", "created_at", "updated_at")
+_DEAL_LIST_KEYS = ("deal_id", "creator_id", "description", "amount", "status", "created_at", "id")
+
+_USER_COLS = ", ".join(_USER_KEYS)
+_DEAL_COLS = ", ".join(_DEAL_KEYS)
+_DEAL_LIST_COLS = ", ".join(_DEAL_LIST_KEYS)
+
+# SQL statements, kept as constants so sqlite3's statement cache reuses them
+_SQL_INSERT_USER = "INSERT OR REPLACE INTO users (user_id, username, first_name) VALUES (?, ?, ?)"
+_SQL_GET_USER = f"SELECT {_USER_COLS} FROM users WHERE user_id = ?"
+_SQL_INSERT_DEAL = """INSERT INTO deals (deal_id, creator_id, description, amount, terms) 
+                      VALUES (?, ?, ?, ?, ?)"""
+_SQL_GET_DEAL = f"SELECT {_DEAL_COLS} FROM deals WHERE deal_id = ?"
+# Listings page on (created_at, id): created_at has one-second resolution, id breaks ties
+_DEAL_PAGE_ORDER = "ORDER BY created_at DESC, id DESC LIMIT ?"
+_SQL_GET_USER_DEALS = f"SELECT {_DEAL_LIST_COLS} FROM deals WHERE creator_id = ? {_DEAL_PAGE_ORDER}"
+_SQL_GET_USER_DEALS_BEFORE = f"SELECT {_DEAL_LIST_COLS} FROM deals WHERE creator_id = ? AND (created_at, id) < (?, ?) {_DEAL_PAGE_ORDER}"
+_SQL_GET_DEALS_BY_STATUS = f"SELECT {_DEAL_LIST_COLS} FROM deals WHERE status = ? {_DEAL_PAGE_ORDER}"
+_SQL_GET_DEALS_BY_STATUS_BEFORE = f"SELECT {_DEAL_LIST_COLS} FROM deals WHERE status = ? AND (created_at, id) < (?, ?) {_DEAL_PAGE_ORDER}"
+_SQL_GET_ALL_DEALS = f"SELECT {_DEAL_LIST_COLS} FROM deals {_DEAL_PAGE_ORDER}"
+_SQL_GET_ALL_DEALS_BEFORE = f"SELECT {_DEAL_LIST_COLS} FROM deals WHERE (created_at, id) < (?, ?) {_DEAL_PAGE_ORDER}"
+_SQL_UPDATE_DEAL_STATUS = "UPDATE deals SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE deal_id = ?"
+_SQL_INSERT_PAYMENT = """INSERT INTO payments (deal_id, payer_id, amount, payment_method, reference_id, status) 
+                         VALUES (?, ?, ?, ?, ?, ?)"""
+_SQL_DEAL_STATS = """
+    SELECT
+        COUNT(*),
+        SUM(CASE WHEN status IN ('created', 'funded') THEN 1 ELSE 0 END),
+        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN status = 'disputed' THEN 1 ELSE 0 END),
+        COALESCE(SUM(CASE WHEN status IN ('created', 'funded') THEN amount END), 0)
+    FROM deals
+"""
+
+# Shared pool, opened lazily and reused by every helper
+_pool = ConnectionPool(DATABASE_FILE, DATABASE_READERS)
+
+# Dashboard stats cache, refreshed at most every _STATS_TTL seconds
+_STATS_TTL = 5.0
+_stats_cache = {"ts": 0.0, "val": None}
+
+# Last action time per user for rate limiting (not persisted across restarts)
+_RATE_LIMIT_SWEEP_SIZE = 10000
+_last_action: Dict[int, float] = {}
+
+async def close_db():
+    """Close all database connections"""
+    
+    await _pool.close()
+
+@asynccontextmanager
+async def transaction():
+    """Run writes in a single BEGIN IMMEDIATE transaction"""
+    
+    async with _pool.write() as db:
+        await db.execute("BEGIN IMMEDIATE")
+        # Commit inside the try so a failed COMMIT also rolls back and the
+        # shared writer never stays inside an open transaction
+        try:
+            yield db
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+
+async def init_db():
+    """Initialize the database with required tables"""
+    
+    async with _pool.write() as db:
+        await _create_schema(db)
+
+async def _create_schema(db: aiosqlite.Connection):
+    """Create tables and indexes"""
+    
+    # Users table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            user_id INTEGER PRIMARY KEY,
+            username TEXT,
+            first_name TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active BOOLEAN DEFAULT 1
+        )
+    """)
+    
+    # Deals table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS deals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            deal_id TEXT UNIQUE NOT NULL,
+            creator_id INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            amount REAL NOT NULL,
+            terms TEXT NOT NULL,
+            status TEXT DEFAULT 'created',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (creator_id) REFERENCES users (user_id)
+        )
+    """)
+    
+    # Payments table
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS payments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            deal_id TEXT NOT NULL,
+            payer_id INTEGER NOT NULL,
+            amount REAL NOT NULL,
+            payment_method TEXT NOT NULL,
+            reference_id TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (deal_id) REFERENCES deals (deal_id),
+            FOREIGN KEY (payer_id) REFERENCES users (user_id)
+        )
+    """)
+    
+    # Indexes for deal listings, stats and payment lookups; listing indexes
+    # match the (created_at, id) page order, replacing the created_at-only ones
+    await db.execute("DROP INDEX IF EXISTS idx_deals_creator_created")
+    await db.execute("DROP INDEX IF EXISTS idx_deals_status_created")
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deals_creator_page ON deals(creator_id, created_at DESC, id DESC)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deals_status_page ON deals(status, created_at DESC, id DESC)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deals_created_page ON deals(created_at DESC, id DESC)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_payments_deal ON payments(deal_id)"
+    )
+    await db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_payments_payer ON payments(payer_id)"
+    )
+
+    await db.commit()
 
 async def create_user(user_id: int, username: str, first_name: str) -> bool:
     """Create a new user"""
     
     try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            await db.execute(
-                "INSERT OR REPLACE INTO users (user_id, username, first_name) VALUES (?, ?, ?)",
-                (user_id, username, first_name)
-            )
-            await db.commit()
-            return True
-    except Exception as e:
-        print(f"Error creating user: {e}")
+        async with transaction() as db:
+            await db.execute(_SQL_INSERT_USER, (user_id, username, first_name))
+        return True
+    except Exception:
+        logger.exception("Error creating user")
         return False
 
 async def get_user(user_id: int) -> Optional[Dict]:
     """Get user by ID"""
     
-    try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM users WHERE user_id = ?", (user_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                return dict(row) if row else None
-    except Exception as e:
-        print(f"Error getting user: {e}")
-        return None
+    async with _pool.read() as db:
+        async with db.execute(_SQL_GET_USER, (user_id,)) as cursor:
+            row = await cursor.fetchone()
+            return dict(zip(_USER_KEYS, row)) if row else None
 
 async def create_deal(deal_id: str, creator_id: int, description: str, amount: float, terms: str) -> bool:
     """Create a new deal"""
     
     try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
+        async with transaction() as db:
             await db.execute(
-                """INSERT INTO deals (deal_id, creator_id, description, amount, terms) 
-                   VALUES (?, ?, ?, ?, ?)""",
+                _SQL_INSERT_DEAL,
                 (deal_id, creator_id, description, amount, terms)
             )
-            await db.commit()
-            return True
-    except Exception as e:
-        print(f"Error creating deal: {e}")
+        _stats_cache["ts"] = 0.0
+        return True
+    except Exception:
+        logger.exception("Error creating deal")
         return False
 
 async def get_deal(deal_id: str) -> Optional[Dict]:
     """Get deal by ID"""
     
-    try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM deals WHERE deal_id = ?", (deal_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                return dict(row) if row else None
-    except Exception as e:
-        print(f"Error getting deal: {e}")
-        return None
+    async with _pool.read() as db:
+        async with db.execute(_SQL_GET_DEAL, (deal_id,)) as cursor:
+            row = await cursor.fetchone()
+            return dict(zip(_DEAL_KEYS, row)) if row else None
 
-async def get_user_deals(user_id: int) -> List[Dict]:
-    """Get all deals for a user"""
+async def get_user_deals(user_id: int, limit: int = 50,
+                         before: Optional[Tuple[str, int]] = None) -> List[Dict]:
+    """Get a page of deals for a user, newest first
     
-    try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM deals WHERE creator_id = ? ORDER BY created_at DESC", 
-                (user_id,)
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-    except Exception as e:
-        print(f"Error getting user deals: {e}")
-        return []
+    Pass (created_at, id) of the last deal on the previous page as
+    before to fetch the next page.
+    """
+    
+    if before:
+        query = _SQL_GET_USER_DEALS_BEFORE
+        params = (user_id, *before, limit)
+    else:
+        query = _SQL_GET_USER_DEALS
+        params = (user_id, limit)
+    
+    async with _pool.read() as db:
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(zip(_DEAL_LIST_KEYS, row)) for row in rows]
 
-async def get_all_deals(status: str = None) -> List[Dict]:
-    """Get all deals, optionally filtered by status"""
+async def get_all_deals(status: str = None, limit: int = 50,
+                        before: Optional[Tuple[str, int]] = None) -> List[Dict]:
+    """Get a page of deals, newest first, optionally filtered by status
     
-    try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            db.row_factory = aiosqlite.Row
-            if status:
-                query = "SELECT * FROM deals WHERE status = ? ORDER BY created_at DESC"
-                params = (status,)
-            else:
-                query = "SELECT * FROM deals ORDER BY created_at DESC"
-                params = ()
-            
-            async with db.execute(query, params) as cursor:
-                rows = await cursor.fetchall()
-                return [dict(row) for row in rows]
-    except Exception as e:
-        print(f"Error getting all deals: {e}")
-        return []
+    Paged the same way as get_user_deals.
+    """
+    
+    if status and before:
+        query = _SQL_GET_DEALS_BY_STATUS_BEFORE
+        params = (status, *before, limit)
+    elif status:
+        query = _SQL_GET_DEALS_BY_STATUS
+        params = (status, limit)
+    elif before:
+        query = _SQL_GET_ALL_DEALS_BEFORE
+        params = (*before, limit)
+    else:
+        query = _SQL_GET_ALL_DEALS
+        params = (limit,)
+    
+    async with _pool.read() as db:
+        async with db.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return [dict(zip(_DEAL_LIST_KEYS, row)) for row in rows]
 
 async def update_deal_status(deal_id: str, status: str) -> bool:
     """Update deal status"""
     
     try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            await db.execute(
-                "UPDATE deals SET status = ?, updated_at = CURRENT_TIMESTAMP WHERE deal_id = ?",
-                (status, deal_id)
-            )
-            await db.commit()
-            return True
-    except Exception as e:
-        print(f"Error updating deal status: {e}")
+        async with transaction() as db:
+            await db.execute(_SQL_UPDATE_DEAL_STATUS, (status, deal_id))
+        _stats_cache["ts"] = 0.0
+        return True
+    except Exception:
+        logger.exception("Error updating deal status")
         return False
 
 async def create_payment_record(deal_id: str, payer_id: int, amount: float, 
@@ -183,93 +363,82 @@ async def create_payment_record(deal_id: str, payer_id: int, amount: float,
     """Create a payment record"""
     
     try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
+        async with transaction() as db:
             await db.execute(
-                """INSERT INTO payments (deal_id, payer_id, amount, payment_method, reference_id, status) 
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+                _SQL_INSERT_PAYMENT,
                 (deal_id, payer_id, amount, payment_method, reference_id, status)
             )
-            await db.commit()
-            return True
-    except Exception as e:
-        print(f"Error creating payment record: {e}")
+        return True
+    except Exception:
+        logger.exception("Error creating payment record")
         return False
 
-async def get_deal_stats() -> Dict:
-    """Get dashboard statistics"""
+async def bulk_create_payments(rows: Iterable[Tuple]) -> bool:
+    """Create many payment records in one transaction
+    
+    Each row is (deal_id, payer_id, amount, payment_method, reference_id, status).
+    """
     
     try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            stats = {}
-            
-            # Total deals
-            async with db.execute("SELECT COUNT(*) FROM deals") as cursor:
-                result = await cursor.fetchone()
-                stats['total_deals'] = result[0] if result else 0
-            
-            # Active deals (created or funded)
-            async with db.execute(
-                "SELECT COUNT(*) FROM deals WHERE status IN ('created', 'funded')"
-            ) as cursor:
-                result = await cursor.fetchone()
-                stats['active_deals'] = result[0] if result else 0
-            
-            # Completed deals
-            async with db.execute(
-                "SELECT COUNT(*) FROM deals WHERE status = 'completed'"
-            ) as cursor:
-                result = await cursor.fetchone()
-                stats['completed_deals'] = result[0] if result else 0
-            
-            # Disputed deals
-            async with db.execute(
-                "SELECT COUNT(*) FROM deals WHERE status = 'disputed'"
-            ) as cursor:
-                result = await cursor.fetchone()
-                stats['disputed_deals'] = result[0] if result else 0
-            
-            # Total escrow value (active deals)
-            async with db.execute(
-                "SELECT SUM(amount) FROM deals WHERE status IN ('created', 'funded')"
-            ) as cursor:
-                result = await cursor.fetchone()
-                stats['total_value'] = result[0] if result and result[0] else 0
-            
-            return stats
-            
-    except Exception as e:
-        print(f"Error getting deal stats: {e}")
-        return {}
+        async with transaction() as db:
+            await db.executemany(_SQL_INSERT_PAYMENT, rows)
+        return True
+    except Exception:
+        logger.exception("Error creating payment records")
+        return False
 
-async def check_rate_limit(user_id: int, limit_seconds: int = 5) -> bool:
-    """Check if user is within rate limit"""
+async def fund_deal(deal_id: str, payer_id: int, amount: float, 
+                    payment_method: str, reference_id: str, status: str) -> bool:
+    """Record a payment and mark the deal funded in one transaction"""
     
     try:
-        async with aiosqlite.connect(DATABASE_FILE) as db:
-            now = datetime.now()
-            
-            # Get last action
-            async with db.execute(
-                "SELECT last_action FROM rate_limits WHERE user_id = ?", (user_id,)
-            ) as cursor:
-                result = await cursor.fetchone()
-            
-            if result:
-                last_action = datetime.fromisoformat(result[0])
-                time_diff = (now - last_action).total_seconds()
-                
-                if time_diff < limit_seconds:
-                    return False  # Rate limited
-            
-            # Update rate limit record
+        async with transaction() as db:
             await db.execute(
-                "INSERT OR REPLACE INTO rate_limits (user_id, last_action) VALUES (?, ?)",
-                (user_id, now.isoformat())
+                _SQL_INSERT_PAYMENT,
+                (deal_id, payer_id, amount, payment_method, reference_id, status)
             )
-            await db.commit()
-            
-            return True  # Within rate limit
-            
-    except Exception as e:
-        print(f"Error checking rate limit: {e}")
-        return True  # Allow on error
+            await db.execute(_SQL_UPDATE_DEAL_STATUS, ('funded', deal_id))
+        _stats_cache["ts"] = 0.0
+        return True
+    except Exception:
+        logger.exception("Error funding deal")
+        return False
+
+async def get_deal_stats() -> Dict:
+    """Get dashboard statistics"""
+    
+    if _stats_cache["val"] is not None and time.monotonic() - _stats_cache["ts"] < _STATS_TTL:
+        return _stats_cache["val"]
+    
+    async with _pool.read() as db:
+        async with db.execute(_SQL_DEAL_STATS) as cursor:
+            result = await cursor.fetchone()
+    
+    stats = {
+        'total_deals': result[0] or 0,
+        'active_deals': result[1] or 0,
+        'completed_deals': result[2] or 0,
+        'disputed_deals': result[3] or 0,
+        'total_value': result[4] or 0
+    }
+    
+    _stats_cache["val"] = stats
+    _stats_cache["ts"] = time.monotonic()
+    return stats
+
+async def check_rate_limit(user_id: int, limit_seconds: int = 5) -> bool:
+    """Check if user is within rate limit"""
+    
+    now = time.monotonic()
+    last_action = _last_action.get(user_id)
+    
+    if last_action is not None and now - last_action < limit_seconds:
+        return False  # Rate limited
+    
+    # Drop stale entries once the table grows large
+    if len(_last_action) >= _RATE_LIMIT_SWEEP_SIZE:
+        for stale_id in [uid for uid, ts in _last_action.items() if now - ts >= limit_seconds]:
+            del _last_action[stale_id]
+    
+    _last_action[user_id] = now
+    return True  # Within rate limit
@@ -11,17 +11,24 @@ from aiogram.fsm.state import State, StatesGroup
 
 from utils.keyboard import (
     get_main_menu, get_deal_keyboard, get_deal_management_keyboard,
-    get_confirmation_keyboard
+    get_confirmation_keyboard, get_my_deals_keyboard
 )
 from utils.database import (
     create_deal, get_deal, get_user_deals, update_deal_status,
     get_all_deals
 )
-from utils.security import rate_limit
+from utils.security import rate_limit, invalidate_deal_access, is_admin
 from config import EMOJIS, DEAL_CREATED_MESSAGE
 
 router = Router()
 
+# My Deals paging; next-page callbacks carry the (id, created_at) cursor of the last deal shown
+_DEALS_PAGE_SIZE = 10
+_MY_DEALS_NEXT = "my_deals_next_"
+
+# Sent when the deal could not be saved; the form is kept so it can be confirmed again
+_DEAL_CREATE_FAILED = f"{EMOJIS['error']} Could not create your deal. Please try again."
+
 class DealStates(StatesGroup):
     waiting_for_description = State()
     waiting_for_amount = State()
@@ -197,7 +204,7 @@ async def confirm_deal_creation(callback: CallbackQuery, state: FSMContext):
     deal_id = str(uuid.uuid4())[:8].upper()
     
     # Create deal in database
-    await create_deal(
+    created = await create_deal(
         deal_id=deal_id,
         creator_id=user_id,
         description=data['description'],
@@ -205,6 +212,13 @@ async def confirm_deal_creation(callback: CallbackQuery, state: FSMContext):
         terms=data['terms']
     )
     
+    if not created:
+        # Keep the form state and confirmation keyboard so the user can retry
+        await callback.answer(_DEAL_CREATE_FAILED, show_alert=True)
+        return
+    
+    invalidate_deal_access(deal_id)
+    
     await state.clear()
     
     success_text = DEAL_CREATED_MESSAGE.format(
@@ -232,12 +246,23 @@ async def cancel_deal_creation(callback: CallbackQuery, state: FSMContext):
     
     await callback.answer("Cancelled")
 
-@router.callback_query(F.data == "my_deals")
+@router.callback_query((F.data == "my_deals") | F.data.startswith(_MY_DEALS_NEXT))
 async def show_my_deals(callback: CallbackQuery):
-    """Show user's deals"""
+    """Show user's deals, one page at a time"""
     
     user_id = callback.from_user.id
-    deals = await get_user_deals(user_id)
+    
+    before = None
+    if callback.data.startswith(_MY_DEALS_NEXT):
+        last_id, last_created_at = callback.data[len(_MY_DEALS_NEXT):].split("_", 1)
+        before = (last_created_at, int(last_id))
+    
+    # Fetch one extra row to tell whether another page follows
+    deals = await get_user_deals(user_id, limit=_DEALS_PAGE_SIZE + 1, before=before)
+    next_page = None
+    if len(deals) > _DEALS_PAGE_SIZE:
+        deals = deals[:_DEALS_PAGE_SIZE]
+        next_page = f"{_MY_DEALS_NEXT}{deals[-1]['id']}_{deals[-1]['created_at']}"
     
     if not deals:
         await callback.message.edit_text(
@@ -271,9 +296,12 @@ Create your first secure deal now!
 
 """
     
+    if next_page:
+        deals_text += f"{EMOJIS['status']} <i>Older deals on the next page.</i>"
+    
     await callback.message.edit_text(
         deals_text,
-        reply_markup=get_main_menu()
+        reply_markup=get_my_deals_keyboard(next_page)
     )
     
     await callback.answer()
@@ -333,7 +361,6 @@ async def share_deal(callback: CallbackQuery):
     
     # Check if user has permission to share (creator or admin)
     user_id = callback.from_user.id
-    from utils.security import is_admin
     is_creator = deal['creator_id'] == user_id
     username = callback.from_user.username or ""
     is_admin_user = await is_admin(user_id, username)
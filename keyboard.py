@@ -2,102 +2,162 @@
 Inline keyboard utilities
 """
 
+from functools import lru_cache
+from typing import Optional
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from config import EMOJIS
 
+# Button labels
+_TXT_CREATE_DEAL = f"{EMOJIS['deal']} Create Deal"
+_TXT_MY_DEALS = f"{EMOJIS['status']} My Deals"
+_TXT_PAYMENT_STATUS = f"{EMOJIS['money']} Payment Status"
+_TXT_SUPPORT = f"{EMOJIS['dispute']} Support"
+_TXT_HOW_IT_WORKS = f"{EMOJIS['lightning']} How It Works"
+_TXT_SECURITY = f"{EMOJIS['shield']} Security"
+_TXT_GET_STARTED = f"{EMOJIS['rocket']} Get Started"
+_TXT_CONFIRM_DEAL = f"{EMOJIS['success']} Create Deal"
+_TXT_CANCEL = f"{EMOJIS['error']} Cancel"
+_TXT_PAY_NOW = f"{EMOJIS['money']} Pay Now"
+_TXT_VIEW_DEAL = f"{EMOJIS['status']} View Details"
+_TXT_SHARE_DEAL = f"{EMOJIS['lock']} Share Deal"
+_TXT_BACK_TO_MENU = f"{EMOJIS['lightning']} Back to Menu"
+_TXT_RELEASE_PAYMENT = f"{EMOJIS['send']} Release Payment"
+_TXT_CREATE_DISPUTE = f"{EMOJIS['dispute']} Create Dispute"
+_TXT_CONTACT_ADMIN = f"{EMOJIS['admin']} Contact Admin"
+_TXT_PAYMENT_DONE = f"{EMOJIS['success']} Payment Done"
+_TXT_GENERATE_NEW_QR = f"{EMOJIS['qr']} Generate New QR"
+_TXT_BACK_TO_DEAL = f"{EMOJIS['lightning']} Back to Deal"
+_TXT_ALL_DEALS = f"{EMOJIS['deal']} All Deals"
+_TXT_DISPUTES = f"{EMOJIS['warning']} Disputes"
+_TXT_BROADCAST = f"{EMOJIS['rocket']} Broadcast"
+_TXT_STATISTICS = f"{EMOJIS['diamond']} Statistics"
+_TXT_SECURITY_LOG = f"{EMOJIS['shield']} Security Log"
+_TXT_SYSTEM_STATUS = f"{EMOJIS['key']} System Status"
+_TXT_RESOLVE_RELEASE = f"{EMOJIS['success']} Resolve (Release)"
+_TXT_CANCEL_DEAL = f"{EMOJIS['error']} Cancel Deal"
+_TXT_FORCE_RELEASE = f"{EMOJIS['send']} Force Release"
+_TXT_ADMIN_VIEW_DETAILS = f"{EMOJIS['lock']} View Details"
+_TXT_BACK_TO_ADMIN = f"{EMOJIS['shield']} Back to Admin"
+_TXT_MORE_DEALS = f"{EMOJIS['status']} More Deals"
+_TXT_MORE_DISPUTES = f"{EMOJIS['warning']} More Disputes"
+
+_MAIN_MENU = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(
+            text=_TXT_CREATE_DEAL,
+            callback_data="create_deal"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_MY_DEALS,
+            callback_data="my_deals"
+        )
+    ],
+    [
+        InlineKeyboardButton(
+            text=_TXT_PAYMENT_STATUS,
+            callback_data="payment_status"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_SUPPORT,
+            callback_data="support"
+        )
+    ],
+    [
+        InlineKeyboardButton(
+            text=_TXT_HOW_IT_WORKS,
+            callback_data="how_it_works"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_SECURITY,
+            callback_data="security_info"
+        )
+    ]
+])
+
 def get_main_menu() -> InlineKeyboardMarkup:
     """Get the main menu keyboard with cyberpunk styling"""
     
+    return _MAIN_MENU
+
+def _with_next_page(base: InlineKeyboardMarkup, text: str, callback_data: str) -> InlineKeyboardMarkup:
+    """Prepend a next-page button to a prebuilt keyboard"""
+    
     keyboard = [
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['deal']} Create Deal",
-                callback_data="create_deal"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['status']} My Deals",
-                callback_data="my_deals"
+                text=text,
+                callback_data=callback_data
             )
         ],
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['money']} Payment Status",
-                callback_data="payment_status"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['dispute']} Support",
-                callback_data="support"
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['lightning']} How It Works",
-                callback_data="how_it_works"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['shield']} Security",
-                callback_data="security_info"
-            )
-        ]
+        *base.inline_keyboard
     ]
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
+def get_my_deals_keyboard(next_page: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Get the main menu, with a next-page button when more deals exist"""
+    
+    if next_page is None:
+        return _MAIN_MENU
+    
+    return _with_next_page(_MAIN_MENU, _TXT_MORE_DEALS, next_page)
+
+_ONBOARDING = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(
+            text=_TXT_GET_STARTED,
+            callback_data="start_onboarding"
+        )
+    ]
+])
+
 def get_onboarding_keyboard() -> InlineKeyboardMarkup:
     """Get onboarding keyboard"""
     
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['rocket']} Get Started",
-                callback_data="start_onboarding"
-            )
-        ]
+    return _ONBOARDING
+
+_CONFIRMATION = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(
+            text=_TXT_CONFIRM_DEAL,
+            callback_data="confirm_deal"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_CANCEL,
+            callback_data="cancel_deal_creation"
+        )
     ]
-    
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+])
 
 def get_confirmation_keyboard() -> InlineKeyboardMarkup:
     """Get confirmation keyboard for deal creation"""
     
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['success']} Create Deal",
-                callback_data="confirm_deal"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['error']} Cancel",
-                callback_data="cancel_deal_creation"
-            )
-        ]
-    ]
-    
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return _CONFIRMATION
 
+@lru_cache(maxsize=2048)
 def get_deal_keyboard(deal_id: str) -> InlineKeyboardMarkup:
     """Get keyboard for a specific deal"""
     
     keyboard = [
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['money']} Pay Now",
+                text=_TXT_PAY_NOW,
                 callback_data=f"pay_deal_{deal_id}"
             ),
             InlineKeyboardButton(
-                text=f"{EMOJIS['status']} View Details",
+                text=_TXT_VIEW_DEAL,
                 callback_data=f"deal_{deal_id}"
             )
         ],
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['lock']} Share Deal",
+                text=_TXT_SHARE_DEAL,
                 callback_data=f"share_deal_{deal_id}"
             )
         ],
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['lightning']} Back to Menu",
+                text=_TXT_BACK_TO_MENU,
                 callback_data="main_menu"
             )
         ]
@@ -105,6 +165,7 @@ def get_deal_keyboard(deal_id: str) -> InlineKeyboardMarkup:
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
+@lru_cache(maxsize=2048)
 def get_deal_management_keyboard(deal_id: str, status: str) -> InlineKeyboardMarkup:
     """Get management keyboard based on deal status"""
     
@@ -113,7 +174,7 @@ def get_deal_management_keyboard(deal_id: str, status: str) -> InlineKeyboardMar
     if status == 'created':
         keyboard.append([
             InlineKeyboardButton(
-                text=f"{EMOJIS['money']} Pay Now",
+                text=_TXT_PAY_NOW,
                 callback_data=f"pay_deal_{deal_id}"
             )
         ])
@@ -122,13 +183,13 @@ def get_deal_management_keyboard(deal_id: str, status: str) -> InlineKeyboardMar
         keyboard.extend([
             [
                 InlineKeyboardButton(
-                    text=f"{EMOJIS['send']} Release Payment",
+                    text=_TXT_RELEASE_PAYMENT,
                     callback_data=f"release_payment_{deal_id}"
                 )
             ],
             [
                 InlineKeyboardButton(
-                    text=f"{EMOJIS['dispute']} Create Dispute",
+                    text=_TXT_CREATE_DISPUTE,
                     callback_data=f"dispute_deal_{deal_id}"
                 )
             ]
@@ -137,7 +198,7 @@ def get_deal_management_keyboard(deal_id: str, status: str) -> InlineKeyboardMar
     elif status == 'disputed':
         keyboard.append([
             InlineKeyboardButton(
-                text=f"{EMOJIS['admin']} Contact Admin",
+                text=_TXT_CONTACT_ADMIN,
                 url="https://t.me/darx_zerox"
             )
         ])
@@ -146,13 +207,13 @@ def get_deal_management_keyboard(deal_id: str, status: str) -> InlineKeyboardMar
     keyboard.extend([
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['lock']} Share Deal",
+                text=_TXT_SHARE_DEAL,
                 callback_data=f"share_deal_{deal_id}"
             )
         ],
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['lightning']} Back to Menu",
+                text=_TXT_BACK_TO_MENU,
                 callback_data="main_menu"
             )
         ]
@@ -160,25 +221,26 @@ def get_deal_management_keyboard(deal_id: str, status: str) -> InlineKeyboardMar
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
+@lru_cache(maxsize=2048)
 def get_payment_keyboard(deal_id: str) -> InlineKeyboardMarkup:
     """Get payment confirmation keyboard"""
     
     keyboard = [
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['success']} Payment Done",
+                text=_TXT_PAYMENT_DONE,
                 callback_data=f"payment_done_{deal_id}"
             )
         ],
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['qr']} Generate New QR",
+                text=_TXT_GENERATE_NEW_QR,
                 callback_data=f"regenerate_qr_{deal_id}"
             )
         ],
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['lightning']} Back to Deal",
+                text=_TXT_BACK_TO_DEAL,
                 callback_data=f"deal_{deal_id}"
             )
         ]
@@ -186,44 +248,53 @@ def get_payment_keyboard(deal_id: str) -> InlineKeyboardMarkup:
     
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
+_ADMIN = InlineKeyboardMarkup(inline_keyboard=[
+    [
+        InlineKeyboardButton(
+            text=_TXT_ALL_DEALS,
+            callback_data="admin_all_deals"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_DISPUTES,
+            callback_data="admin_disputes"
+        )
+    ],
+    [
+        InlineKeyboardButton(
+            text=_TXT_BROADCAST,
+            callback_data="admin_broadcast"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_STATISTICS,
+            callback_data="admin_stats"
+        )
+    ],
+    [
+        InlineKeyboardButton(
+            text=_TXT_SECURITY_LOG,
+            callback_data="admin_security"
+        ),
+        InlineKeyboardButton(
+            text=_TXT_SYSTEM_STATUS,
+            callback_data="admin_system"
+        )
+    ]
+])
+
 def get_admin_keyboard() -> InlineKeyboardMarkup:
     """Get admin panel keyboard"""
     
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['deal']} All Deals",
-                callback_data="admin_all_deals"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['warning']} Disputes",
-                callback_data="admin_disputes"
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['rocket']} Broadcast",
-                callback_data="admin_broadcast"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['diamond']} Statistics",
-                callback_data="admin_stats"
-            )
-        ],
-        [
-            InlineKeyboardButton(
-                text=f"{EMOJIS['shield']} Security Log",
-                callback_data="admin_security"
-            ),
-            InlineKeyboardButton(
-                text=f"{EMOJIS['key']} System Status",
-                callback_data="admin_system"
-            )
-        ]
-    ]
+    return _ADMIN
+
+def get_disputes_keyboard(next_page: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Get the admin panel, with a next-page button when more disputes exist"""
     
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    if next_page is None:
+        return _ADMIN
+    
+    return _with_next_page(_ADMIN, _TXT_MORE_DISPUTES, next_page)
 
+@lru_cache(maxsize=2048)
 def get_admin_deal_keyboard(deal_id: str, status: str) -> InlineKeyboardMarkup:
     """Get admin actions keyboard for a specific deal"""
     
@@ -232,11 +303,11 @@ def get_admin_deal_keyboard(deal_id: str, status: str) -> InlineKeyboardMarkup:
     if status == 'disputed':
         keyboard.append([
             InlineKeyboardButton(
-                text=f"{EMOJIS['success']} Resolve (Release)",
+                text=_TXT_RESOLVE_RELEASE,
                 callback_data=f"admin_resolve_{deal_id}"
             ),
             InlineKeyboardButton(
-                text=f"{EMOJIS['error']} Cancel Deal",
+                text=_TXT_CANCEL_DEAL,
                 callback_data=f"admin_cancel_{deal_id}"
             )
         ])
@@ -245,13 +316,13 @@ def get_admin_deal_keyboard(deal_id: str, status: str) -> InlineKeyboardMarkup:
         keyboard.extend([
             [
                 InlineKeyboardButton(
-                    text=f"{EMOJIS['send']} Force Release",
+                    text=_TXT_FORCE_RELEASE,
                     callback_data=f"admin_resolve_{deal_id}"
                 )
             ],
             [
                 InlineKeyboardButton(
-                    text=f"{EMOJIS['error']} Cancel Deal",
+                    text=_TXT_CANCEL_DEAL,
                     callback_data=f"admin_cancel_{deal_id}"
                 )
             ]
@@ -261,13 +332,13 @@ def get_admin_deal_keyboard(deal_id: str, status: str) -> InlineKeyboardMarkup:
     keyboard.extend([
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['lock']} View Details",
+                text=_TXT_ADMIN_VIEW_DETAILS,
                 callback_data=f"admin_deal_details_{deal_id}"
             )
         ],
         [
             InlineKeyboardButton(
-                text=f"{EMOJIS['shield']} Back to Admin",
+                text=_TXT_BACK_TO_ADMIN,
                 callback_data="back_to_admin"
             )
         ]
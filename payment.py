@@ -11,7 +11,7 @@ from aiogram.fsm.state import State, StatesGroup
 
 from utils.keyboard import get_payment_keyboard, get_main_menu
 from utils.qr_generator import generate_upi_qr
-from utils.database import get_deal, update_deal_status, create_payment_record
+from utils.database import get_deal, update_deal_status, fund_deal
 from utils.security import rate_limit
 from config import EMOJIS, DEFAULT_UPI_ID
 
@@ -178,6 +178,9 @@ Send your UPI transaction reference number
     
     await callback.answer(f"{EMOJIS['loading']} Waiting for payment proof...")
 
+# Sent when the payment and funded status could not be saved; the proof can be resent
+_PAYMENT_RECORD_FAILED = f"{EMOJIS['error']} Could not record your payment. Please send the proof again."
+
 @router.message(PaymentStates.waiting_for_payment_proof)
 async def process_payment_proof(message: Message, state: FSMContext):
     """Process payment proof (screenshot or reference ID)"""
@@ -196,8 +199,8 @@ async def process_payment_proof(message: Message, state: FSMContext):
         # Mock payment verification (in real app, this would integrate with payment gateway)
         payment_id = str(uuid.uuid4())[:12].upper()
         
-        # Create payment record
-        await create_payment_record(
+        # Record payment and mark deal funded
+        funded = await fund_deal(
             deal_id=deal_id,
             payer_id=message.from_user.id,
             amount=amount,
@@ -206,8 +209,9 @@ async def process_payment_proof(message: Message, state: FSMContext):
             status='pending_verification'
         )
         
-        # Update deal status
-        await update_deal_status(deal_id, 'funded')
+        if not funded:
+            await message.answer(_PAYMENT_RECORD_FAILED)
+            return
         
         success_text = f"""
 {EMOJIS['success']} <b>Payment Received!</b>
@@ -244,8 +248,8 @@ async def process_payment_proof(message: Message, state: FSMContext):
         # Mock payment verification
         payment_id = str(uuid.uuid4())[:12].upper()
         
-        # Create payment record
-        await create_payment_record(
+        # Record payment and mark deal funded
+        funded = await fund_deal(
             deal_id=deal_id,
             payer_id=message.from_user.id,
             amount=amount,
@@ -254,8 +258,9 @@ async def process_payment_proof(message: Message, state: FSMContext):
             status='pending_verification'
         )
         
-        # Update deal status
-        await update_deal_status(deal_id, 'funded')
+        if not funded:
+            await message.answer(_PAYMENT_RECORD_FAILED)
+            return
         
         success_text = f"""
 {EMOJIS['success']} <b>Payment Verified!</b>
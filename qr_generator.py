@@ -7,10 +7,101 @@ from qrcode.image.styledpil import StyledPilImage
 from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
 from qrcode.image.styles.colormasks import SquareGradiantColorMask
 from PIL import Image, ImageDraw, ImageFont
+from io import BytesIO
+from collections import OrderedDict
+import hashlib
+from typing import Optional
 import os
 
-def generate_upi_qr(upi_url: str, filename: str = "payment_qr.png") -> bool:
-    """Generate a stylized UPI QR code"""
+# Canvas layout
+_CANVAS_SIZE = (600, 700)
+
+# Fonts are loaded once and reused for every QR
+try:
+    _TITLE_FONT = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
+    _SUBTITLE_FONT = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
+except OSError:
+    # Fallback to default font
+    _TITLE_FONT = ImageFont.load_default()
+    _SUBTITLE_FONT = ImageFont.load_default()
+
+def _centered_x(text: str, font) -> int:
+    """X offset that horizontally centers text on the canvas"""
+    bbox = font.getbbox(text)
+    return (_CANVAS_SIZE[0] - (bbox[2] - bbox[0])) // 2
+
+# Static labels and their precomputed positions
+_TITLE_TEXT = "🔐 QUICK ESCROW"
+_SUBTITLE_TEXT = "Scan to Pay with UPI"
+_SECURITY_TEXT = "🛡️ Secured by Quick Escrow Bot"
+_INSTRUCTION_TEXT = "⚡ Any UPI app • 💎 Instant • 🔥 Secure"
+
+_TITLE_X = _centered_x(_TITLE_TEXT, _TITLE_FONT)
+_SUBTITLE_X = _centered_x(_SUBTITLE_TEXT, _SUBTITLE_FONT)
+_SECURITY_X = _centered_x(_SECURITY_TEXT, _SUBTITLE_FONT)
+_INSTRUCTION_X = _centered_x(_INSTRUCTION_TEXT, _SUBTITLE_FONT)
+
+# QR code placement on the canvas
+_QR_SIZE = 400
+_QR_X = (_CANVAS_SIZE[0] - _QR_SIZE) // 2
+_QR_Y = 100
+
+def _build_template() -> Image.Image:
+    """Render the static branding (titles and corner brackets) once"""
+    
+    canvas = Image.new('RGB', _CANVAS_SIZE, (10, 14, 39))  # Dark background
+    draw = ImageDraw.Draw(canvas)
+    
+    # Title
+    draw.text((_TITLE_X, 30), _TITLE_TEXT, fill=(0, 212, 255), font=_TITLE_FONT)
+    
+    # Subtitle
+    draw.text((_SUBTITLE_X, 520), _SUBTITLE_TEXT, fill=(255, 255, 255), font=_SUBTITLE_FONT)
+    
+    # Security badge
+    draw.text((_SECURITY_X, 550), _SECURITY_TEXT, fill=(0, 255, 136), font=_SUBTITLE_FONT)
+    
+    # Instructions
+    draw.text((_INSTRUCTION_X, 580), _INSTRUCTION_TEXT, fill=(255, 215, 10), font=_SUBTITLE_FONT)
+    
+    # Corner brackets for cyberpunk effect
+    qr_x, qr_y, qr_size = _QR_X, _QR_Y, _QR_SIZE
+    bracket_color = (0, 212, 255)
+    bracket_width = 3
+    bracket_length = 30
+    
+    # Top-left bracket
+    draw.line([(qr_x-20, qr_y-20), (qr_x-20+bracket_length, qr_y-20)], fill=bracket_color, width=bracket_width)
+    draw.line([(qr_x-20, qr_y-20), (qr_x-20, qr_y-20+bracket_length)], fill=bracket_color, width=bracket_width)
+    
+    # Top-right bracket
+    draw.line([(qr_x+qr_size+20-bracket_length, qr_y-20), (qr_x+qr_size+20, qr_y-20)], fill=bracket_color, width=bracket_width)
+    draw.line([(qr_x+qr_size+20, qr_y-20), (qr_x+qr_size+20, qr_y-20+bracket_length)], fill=bracket_color, width=bracket_width)
+    
+    # Bottom-left bracket
+    draw.line([(qr_x-20, qr_y+qr_size+20-bracket_length), (qr_x-20, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
+    draw.line([(qr_x-20, qr_y+qr_size+20), (qr_x-20+bracket_length, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
+    
+    # Bottom-right bracket
+    draw.line([(qr_x+qr_size+20-bracket_length, qr_y+qr_size+20), (qr_x+qr_size+20, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
+    draw.line([(qr_x+qr_size+20, qr_y+qr_size+20-bracket_length), (qr_x+qr_size+20, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
+    
+    return canvas
+
+_TEMPLATE = _build_template()
+
+# Rendered PNGs keyed by SHA1 of the UPI URL, oldest evicted first
+_QR_CACHE_SIZE = 256
+_qr_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+def generate_upi_qr(upi_url: str) -> Optional[BytesIO]:
+    """Generate a stylized UPI QR code as an in-memory PNG"""
+    
+    cache_key = hashlib.sha1(upi_url.encode()).digest()
+    cached = _qr_cache.get(cache_key)
+    if cached is not None:
+        _qr_cache.move_to_end(cache_key)
+        return BytesIO(cached)
     
     try:
         # Create QR code instance
@@ -25,6 +116,9 @@ def generate_upi_qr(upi_url: str, filename: str = "payment_qr.png") -> bool:
         qr.add_data(upi_url)
         qr.make(fit=True)
         
+        # Pick the largest box size that fits the QR area, so no resampling is needed
+        qr.box_size = max(1, _QR_SIZE // (qr.modules_count + 2 * qr.border))
+        
         # Create stylized QR code with cyberpunk colors
         img = qr.make_image(
             image_factory=StyledPilImage,
@@ -36,87 +130,21 @@ def generate_upi_qr(upi_url: str, filename: str = "payment_qr.png") -> bool:
             )
         )
         
-        # Create a larger canvas with branding
-        canvas_size = (600, 700)
-        canvas = Image.new('RGB', canvas_size, (10, 14, 39))  # Dark background
-        
-        # Resize QR code
-        qr_size = 400
-        img = img.resize((qr_size, qr_size), Image.Resampling.LANCZOS)
-        
-        # Calculate position to center QR code
-        qr_x = (canvas_size[0] - qr_size) // 2
-        qr_y = 100
-        
-        # Paste QR code onto canvas
-        canvas.paste(img, (qr_x, qr_y))
-        
-        # Add title and instructions
-        draw = ImageDraw.Draw(canvas)
-        
-        try:
-            # Try to use a system font
-            title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 32)
-            subtitle_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 18)
-        except:
-            # Fallback to default font
-            title_font = ImageFont.load_default()
-            subtitle_font = ImageFont.load_default()
+        # Paste QR code centered in the QR area of the branded template
+        offset = (_QR_SIZE - img.pixel_size) // 2
+        canvas = _TEMPLATE.copy()
+        canvas.paste(img.get_image(), (_QR_X + offset, _QR_Y + offset))
         
-        # Title
-        title_text = "🔐 QUICK ESCROW"
-        title_bbox = draw.textbbox((0, 0), title_text, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
-        title_x = (canvas_size[0] - title_width) // 2
-        draw.text((title_x, 30), title_text, fill=(0, 212, 255), font=title_font)
+        # Render the final image to memory
+        buf = BytesIO()
+        canvas.save(buf, format="PNG", optimize=False)
+        buf.seek(0)
         
-        # Subtitle
-        subtitle_text = "Scan to Pay with UPI"
-        subtitle_bbox = draw.textbbox((0, 0), subtitle_text, font=subtitle_font)
-        subtitle_width = subtitle_bbox[2] - subtitle_bbox[0]
-        subtitle_x = (canvas_size[0] - subtitle_width) // 2
-        draw.text((subtitle_x, 520), subtitle_text, fill=(255, 255, 255), font=subtitle_font)
+        _qr_cache[cache_key] = buf.getvalue()
+        if len(_qr_cache) > _QR_CACHE_SIZE:
+            _qr_cache.popitem(last=False)
         
-        # Security badge
-        security_text = "🛡️ Secured by Quick Escrow Bot"
-        security_bbox = draw.textbbox((0, 0), security_text, font=subtitle_font)
-        security_width = security_bbox[2] - security_bbox[0]
-        security_x = (canvas_size[0] - security_width) // 2
-        draw.text((security_x, 550), security_text, fill=(0, 255, 136), font=subtitle_font)
-        
-        # Instructions
-        instruction_text = "⚡ Any UPI app • 💎 Instant • 🔥 Secure"
-        instruction_bbox = draw.textbbox((0, 0), instruction_text, font=subtitle_font)
-        instruction_width = instruction_bbox[2] - instruction_bbox[0]
-        instruction_x = (canvas_size[0] - instruction_width) // 2
-        draw.text((instruction_x, 580), instruction_text, fill=(255, 215, 10), font=subtitle_font)
-        
-        # Add decorative elements
-        # Corner brackets for cyberpunk effect
-        bracket_color = (0, 212, 255)
-        bracket_width = 3
-        bracket_length = 30
-        
-        # Top-left bracket
-        draw.line([(qr_x-20, qr_y-20), (qr_x-20+bracket_length, qr_y-20)], fill=bracket_color, width=bracket_width)
-        draw.line([(qr_x-20, qr_y-20), (qr_x-20, qr_y-20+bracket_length)], fill=bracket_color, width=bracket_width)
-        
-        # Top-right bracket
-        draw.line([(qr_x+qr_size+20-bracket_length, qr_y-20), (qr_x+qr_size+20, qr_y-20)], fill=bracket_color, width=bracket_width)
-        draw.line([(qr_x+qr_size+20, qr_y-20), (qr_x+qr_size+20, qr_y-20+bracket_length)], fill=bracket_color, width=bracket_width)
-        
-        # Bottom-left bracket
-        draw.line([(qr_x-20, qr_y+qr_size+20-bracket_length), (qr_x-20, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
-        draw.line([(qr_x-20, qr_y+qr_size+20), (qr_x-20+bracket_length, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
-        
-        # Bottom-right bracket
-        draw.line([(qr_x+qr_size+20-bracket_length, qr_y+qr_size+20), (qr_x+qr_size+20, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
-        draw.line([(qr_x+qr_size+20, qr_y+qr_size+20-bracket_length), (qr_x+qr_size+20, qr_y+qr_size+20)], fill=bracket_color, width=bracket_width)
-        
-        # Save the final image
-        canvas.save(filename, "PNG", quality=95)
-        
-        return True
+        return buf
         
     except Exception as e:
         print(f"Error generating QR code: {e}")
@@ -128,11 +156,13 @@ def generate_upi_qr(upi_url: str, filename: str = "payment_qr.png") -> bool:
             qr.make(fit=True)
             
             img = qr.make_image(fill_color="black", back_color="white")
-            img.save(filename)
+            buf = BytesIO()
+            img.save(buf, format="PNG")
+            buf.seek(0)
             
-            return True
+            return buf
         except:
-            return False
+            return None
 
 def generate_simple_qr(data: str, filename: str = "simple_qr.png") -> bool:
     """Generate a simple QR code as fallback"""
@@ -3,61 +3,121 @@ Security utilities and rate limiting
 """
 
 import asyncio
+import logging
+import queue
+import secrets
+import string
+import time
+from collections import OrderedDict, defaultdict, deque
 from functools import wraps
-from datetime import datetime, timedelta
-from typing import Dict, Set
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime
+from typing import Deque, Dict, Optional, Set, Tuple
 from aiogram.types import Message, CallbackQuery
 
-from utils.database import check_rate_limit
-from config import ADMIN_USER, RATE_LIMIT_SECONDS, EMOJIS
+from utils.database import check_rate_limit, get_deal
+from config import (
+    ADMIN_USER, RATE_LIMIT_SECONDS, RATE_LIMIT_CACHE_SIZE, RATE_LIMIT_MAX_ACTIONS,
+    RATE_LIMIT_WINDOW_SECONDS, RATE_LIMIT_BUCKET_SECONDS, EMOJIS
+)
 
-# In-memory rate limiting for quick checks
-_rate_limit_cache: Dict[int, datetime] = {}
+# In-memory sliding-window rate limiting: per user, a deque of (bucket, count)
+# covering the last RATE_LIMIT_WINDOW_SECONDS; least recently active users evicted first
+_WINDOW_BUCKETS = max(1, RATE_LIMIT_WINDOW_SECONDS // RATE_LIMIT_BUCKET_SECONDS)
+_rate_limit_cache: "OrderedDict[int, Deque[Tuple[int, int]]]" = OrderedDict()
 _blocked_users: Set[int] = set()
 
+# Admin usernames, without the leading '@' and lowercased (Telegram usernames are case-insensitive)
+_ADMIN_USERNAMES = frozenset({ADMIN_USER.lstrip('@').lower()})
+
+# Rate limit warnings
+_RL_MSG_TEMPLATE = f"{EMOJIS['warning']} Please wait {{n}} seconds before next action."
+_RL_CB_MSG = f"{EMOJIS['warning']} Rate limited! Please wait."
+
+# Formatting characters stripped from amounts in a single pass
+_AMOUNT_TRANS = str.maketrans('', '', ',₹')
+
+# Secure ID alphabet: uppercase letters and numbers
+_ID_ALPHABET = string.ascii_uppercase + string.digits
+_ID_ALPHABET_LEN = len(_ID_ALPHABET)
+_ID_BYTE_LIMIT = 256 - 256 % _ID_ALPHABET_LEN
+
+# Deal creator lookups for verify_deal_access, as deal_id -> (expires_at, creator_id)
+_DEAL_ACCESS_TTL = 30.0
+_DEAL_ACCESS_CACHE_SIZE = 10000
+_deal_access_cache: "OrderedDict[str, Tuple[float, Optional[int]]]" = OrderedDict()
+
+# Security events are queued and written to security.log by a background thread;
+# the file stays open between writes and rotates at 10 MB, keeping 5 backups
+_security_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_security_file_handler = RotatingFileHandler(
+    "security.log", maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+)
+_security_file_handler.setFormatter(logging.Formatter("%(message)s"))
+_security_listener = QueueListener(_security_log_queue, _security_file_handler)
+_security_listener.start()
+
+_security_logger = logging.getLogger("security")
+_security_logger.setLevel(logging.INFO)
+_security_logger.propagate = False
+_security_logger.addHandler(QueueHandler(_security_log_queue))
+
 def rate_limit(func):
     """Rate limiting decorator"""
     
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        # Extract user_id from different event types
-        user_id = None
-        
-        for arg in args:
-            if isinstance(arg, (Message, CallbackQuery)):
-                user_id = arg.from_user.id
-                break
+        # Handlers receive the Message or CallbackQuery as their first argument
+        event = args[0] if args else None
+        event_type = type(event)
         
-        if user_id is None:
+        if event_type is not Message and event_type is not CallbackQuery:
             # If we can't determine user_id, allow the request
             return await func(*args, **kwargs)
         
+        user_id = event.from_user.id
+        
         # Check if user is blocked
         if user_id in _blocked_users:
             return
         
-        # Quick in-memory check
-        now = datetime.now()
-        if user_id in _rate_limit_cache:
-            time_diff = (now - _rate_limit_cache[user_id]).total_seconds()
-            if time_diff < RATE_LIMIT_SECONDS:
+        # Quick in-memory check. The window is read and updated with no await in
+        # between, so no lock is needed; keep every await (DB check, handler) after it
+        now = time.monotonic()
+        bucket = int(now // RATE_LIMIT_BUCKET_SECONDS)
+        buckets = _rate_limit_cache.get(user_id)
+        cache_miss = buckets is None
+        
+        if cache_miss:
+            buckets = deque(maxlen=_WINDOW_BUCKETS)
+        else:
+            # Drop buckets that fell out of the window
+            while buckets and bucket - buckets[0][0] >= _WINDOW_BUCKETS:
+                buckets.popleft()
+            
+            if sum(count for _, count in buckets) >= RATE_LIMIT_MAX_ACTIONS:
                 # Rate limited - send warning
-                if isinstance(args[0], Message):
-                    await args[0].answer(
-                        f"{EMOJIS['warning']} Please wait {RATE_LIMIT_SECONDS - int(time_diff)} seconds before next action."
-                    )
-                elif isinstance(args[0], CallbackQuery):
-                    await args[0].answer(
-                        f"{EMOJIS['warning']} Rate limited! Please wait.",
-                        show_alert=True
-                    )
+                if event_type is Message:
+                    wait = (buckets[0][0] + _WINDOW_BUCKETS) * RATE_LIMIT_BUCKET_SECONDS - now
+                    await event.answer(_RL_MSG_TEMPLATE.format(n=max(1, int(wait) + 1)))
+                else:
+                    await event.answer(_RL_CB_MSG, show_alert=True)
                 return
         
+        # Count this action in the current bucket
+        if buckets and buckets[-1][0] == bucket:
+            buckets[-1] = (bucket, buckets[-1][1] + 1)
+        else:
+            buckets.append((bucket, 1))
+        
         # Update rate limit cache
-        _rate_limit_cache[user_id] = now
+        _rate_limit_cache[user_id] = buckets
+        _rate_limit_cache.move_to_end(user_id)
+        if len(_rate_limit_cache) > RATE_LIMIT_CACHE_SIZE:
+            _rate_limit_cache.popitem(last=False)
         
-        # Database check for persistent rate limiting
-        if not await check_rate_limit(user_id, RATE_LIMIT_SECONDS):
+        # Backing check only when the in-memory cache had no entry (new or evicted user)
+        if cache_miss and not await check_rate_limit(user_id, RATE_LIMIT_SECONDS):
             return
         
         # Execute the original function
@@ -69,7 +129,7 @@ async def is_admin(user_id: int, username: str = None) -> bool:
     """Check if user is admin"""
     
     # Check by username
-    if username and f"@{username}" == ADMIN_USER:
+    if username and username.lower() in _ADMIN_USERNAMES:
         return True
     
     # You can add user_id based admin check here
@@ -94,19 +154,19 @@ async def log_security_event(event_type: str, user_id: int, details: str = ""):
     timestamp = datetime.now().isoformat()
     log_entry = f"[{timestamp}] SECURITY: {event_type} - User: {user_id} - {details}"
     
-    # Write to security log file
-    try:
-        with open("security.log", "a") as f:
-            f.write(log_entry + "\n")
-    except Exception as e:
-        print(f"Error writing security log: {e}")
+    # Hand off to the log writer thread so the event loop never touches disk
+    _security_logger.info(log_entry)
+
+def stop_security_log():
+    """Flush queued security events and stop the log writer thread"""
+    _security_listener.stop()
 
 def validate_amount(amount_str: str) -> tuple[bool, float]:
     """Validate and parse amount string"""
     
     try:
         # Remove common formatting
-        cleaned = amount_str.replace(',', '').replace('₹', '').strip()
+        cleaned = amount_str.translate(_AMOUNT_TRANS).strip()
         amount = float(cleaned)
         
         # Basic validation
@@ -127,6 +187,10 @@ def sanitize_text(text: str, max_length: int = 1000) -> str:
     if not text:
         return ""
     
+    # Already clean: nothing to trim, cut or escape
+    if len(text) <= max_length and '<' not in text and '>' not in text and text == text.strip():
+        return text
+    
     # Remove potentially dangerous characters
     sanitized = text.strip()
     
@@ -135,71 +199,84 @@ def sanitize_text(text: str, max_length: int = 1000) -> str:
         sanitized = sanitized[:max_length]
     
     # Basic HTML escape for safety
-    sanitized = sanitized.replace('<', '&lt;').replace('>', '&gt;')
+    if '<' in sanitized or '>' in sanitized:
+        sanitized = sanitized.replace('<', '&lt;').replace('>', '&gt;')
     
     return sanitized
 
 def generate_secure_id(length: int = 8) -> str:
     """Generate a secure random ID"""
     
-    import secrets
-    import string
-    
-    # Use uppercase letters and numbers
-    alphabet = string.ascii_uppercase + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # Draw random bytes in bulk; reject values above the last full multiple
+    # of the alphabet size so every character stays equally likely
+    chars = []
+    while len(chars) < length:
+        for byte in secrets.token_bytes(length):
+            if byte < _ID_BYTE_LIMIT:
+                chars.append(_ID_ALPHABET[byte % _ID_ALPHABET_LEN])
+    return ''.join(chars[:length])
 
 async def verify_deal_access(deal_id: str, user_id: int) -> bool:
     """Verify if user has access to a deal"""
     
-    from utils.database import get_deal
+    now = time.monotonic()
+    cached = _deal_access_cache.get(deal_id)
+    if cached is not None and cached[0] > now:
+        creator_id = cached[1]
+    else:
+        deal = await get_deal(deal_id)
+        creator_id = deal['creator_id'] if deal else None
+        
+        _deal_access_cache[deal_id] = (now + _DEAL_ACCESS_TTL, creator_id)
+        _deal_access_cache.move_to_end(deal_id)
+        if len(_deal_access_cache) > _DEAL_ACCESS_CACHE_SIZE:
+            _deal_access_cache.popitem(last=False)
     
-    deal = await get_deal(deal_id)
-    if not deal:
+    if creator_id is None:
         return False
     
     # Creator always has access
-    if deal['creator_id'] == user_id:
+    if creator_id == user_id:
         return True
     
     # Add additional access logic here (e.g., participants, admin)
     return False
 
+def invalidate_deal_access(deal_id: str):
+    """Drop the cached access data for a deal"""
+    _deal_access_cache.pop(deal_id, None)
+
 class SecurityMonitor:
     """Security monitoring class"""
     
     def __init__(self):
-        self.suspicious_activity: Dict[int, int] = {}
-        self.failed_attempts: Dict[int, int] = {}
+        self.suspicious_activity: Dict[int, int] = defaultdict(int)
+        self.failed_attempts: Dict[int, int] = defaultdict(int)
     
     async def log_failed_attempt(self, user_id: int, attempt_type: str):
         """Log failed attempt"""
         
-        if user_id not in self.failed_attempts:
-            self.failed_attempts[user_id] = 0
-        
+        # Count before any await so concurrent failures can't interleave
         self.failed_attempts[user_id] += 1
+        count = self.failed_attempts[user_id]
         
         await log_security_event(
             "FAILED_ATTEMPT", 
             user_id, 
-            f"Type: {attempt_type}, Count: {self.failed_attempts[user_id]}"
+            f"Type: {attempt_type}, Count: {count}"
         )
         
         # Auto-block after too many failures
-        if self.failed_attempts[user_id] >= 5:
+        if count >= 5:
             block_user(user_id)
             await log_security_event("AUTO_BLOCK", user_id, "Too many failed attempts")
     
     async def log_suspicious_activity(self, user_id: int, activity: str):
         """Log suspicious activity"""
         
-        await log_security_event("SUSPICIOUS", user_id, activity)
-        
-        if user_id not in self.suspicious_activity:
-            self.suspicious_activity[user_id] = 0
-        
         self.suspicious_activity[user_id] += 1
+        
+        await log_security_event("SUSPICIOUS", user_id, activity)
 
 # Global security monitor instance
 security_monitor = SecurityMonitor()
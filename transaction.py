@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
+from types import MappingProxyType
 
 class DealStatus(Enum):
     """Deal status enumeration"""
@@ -15,6 +16,8 @@ class DealStatus(Enum):
     DISPUTED = "disputed"
     CANCELLED = "cancelled"
 
+_DEAL_STATUS_MAP = {m.value: m for m in DealStatus}
+
 class PaymentStatus(Enum):
     """Payment status enumeration"""
     PENDING = "pending"
@@ -22,7 +25,9 @@ class PaymentStatus(Enum):
     FAILED = "failed"
     REFUNDED = "refunded"
 
-@dataclass
+_PAY_STATUS_MAP = {m.value: m for m in PaymentStatus}
+
+@dataclass(slots=True, frozen=True)
 class Deal:
     """Deal model"""
     deal_id: str
@@ -36,6 +41,7 @@ class Deal:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        created_at, updated_at = self.created_at, self.updated_at
         return {
             'deal_id': self.deal_id,
             'creator_id': self.creator_id,
@@ -43,8 +49,8 @@ class Deal:
             'amount': self.amount,
             'terms': self.terms,
             'status': self.status.value,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None
         }
     
     @classmethod
@@ -56,12 +62,12 @@ class Deal:
             description=data['description'],
             amount=data['amount'],
             terms=data['terms'],
-            status=DealStatus(data.get('status', 'created')),
+            status=_DEAL_STATUS_MAP.get(data.get('status', 'created'), DealStatus.CREATED),
             created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None,
             updated_at=datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else None
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Payment:
     """Payment model"""
     payment_id: str
@@ -75,6 +81,7 @@ class Payment:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        created_at = self.created_at
         return {
             'payment_id': self.payment_id,
             'deal_id': self.deal_id,
@@ -83,7 +90,7 @@ class Payment:
             'payment_method': self.payment_method,
             'reference_id': self.reference_id,
             'status': self.status.value,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': created_at.isoformat() if created_at else None
         }
     
     @classmethod
@@ -96,11 +103,11 @@ class Payment:
             amount=data['amount'],
             payment_method=data['payment_method'],
             reference_id=data.get('reference_id'),
-            status=PaymentStatus(data.get('status', 'pending')),
+            status=_PAY_STATUS_MAP.get(data.get('status', 'pending'), PaymentStatus.PENDING),
             created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None
         )
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User model"""
     user_id: int
@@ -111,12 +118,13 @@ class User:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
+        created_at = self.created_at
         return {
             'user_id': self.user_id,
             'username': self.username,
             'first_name': self.first_name,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': created_at.isoformat() if created_at else None
         }
     
     @classmethod
@@ -130,7 +138,7 @@ class User:
             created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None
         )
 
-@dataclass
+@dataclass(slots=True)
 class DealStats:
     """Deal statistics model"""
     total_deals: int = 0
@@ -159,39 +167,54 @@ def format_deal_id(deal_id: str) -> str:
     """Format deal ID for display"""
     return f"#{deal_id}"
 
+# Status emojis, built once and read-only
+_STATUS_EMOJI = MappingProxyType({
+    'created': '⏳',
+    'funded': '💰',
+    'completed': '✅',
+    'disputed': '⚠️',
+    'cancelled': '❌'
+})
+
 def get_status_emoji(status: str) -> str:
     """Get emoji for status"""
-    status_emojis = {
-        'created': '⏳',
-        'funded': '💰',
-        'completed': '✅',
-        'disputed': '⚠️',
-        'cancelled': '❌'
-    }
-    return status_emojis.get(status, '🔒')
+    return _STATUS_EMOJI.get(status, '🔒')
+
+# Deal validation messages
+_ERR_DESC_SHORT = "Description must be at least 10 characters"
+_ERR_DESC_LONG = "Description must be less than 500 characters"
+_ERR_AMOUNT_ZERO = "Amount must be greater than 0"
+_ERR_AMOUNT_MIN = "Minimum amount is ₹100"
+_ERR_AMOUNT_MAX = "Maximum amount is ₹5,00,000"
+_ERR_TERMS_SHORT = "Terms must be at least 20 characters"
+_ERR_TERMS_LONG = "Terms must be less than 1000 characters"
 
 def validate_deal_data(description: str, amount: float, terms: str) -> tuple[bool, str]:
     """Validate deal creation data"""
     
-    if not description or len(description.strip()) < 10:
-        return False, "Description must be at least 10 characters"
+    # Strip each field once and reuse the lengths
+    desc_len = len(description.strip()) if description else 0
+    terms_len = len(terms.strip()) if terms else 0
+    
+    if desc_len < 10:
+        return False, _ERR_DESC_SHORT
     
-    if len(description.strip()) > 500:
-        return False, "Description must be less than 500 characters"
+    if desc_len > 500:
+        return False, _ERR_DESC_LONG
     
     if amount <= 0:
-        return False, "Amount must be greater than 0"
+        return False, _ERR_AMOUNT_ZERO
     
     if amount < 100:
-        return False, "Minimum amount is ₹100"
+        return False, _ERR_AMOUNT_MIN
     
     if amount > 500000:
-        return False, "Maximum amount is ₹5,00,000"
+        return False, _ERR_AMOUNT_MAX
     
-    if not terms or len(terms.strip()) < 20:
-        return False, "Terms must be at least 20 characters"
+    if terms_len < 20:
+        return False, _ERR_TERMS_SHORT
     
-    if len(terms.strip()) > 1000:
-        return False, "Terms must be less than 1000 characters"
+    if terms_len > 1000:
+        return False, _ERR_TERMS_LONG
     
-    return True, "Valid"
+    return True, "Valid"
\ No newline at end of file